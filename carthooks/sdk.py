@@ -1,4 +1,5 @@
 import requests
+from requests.adapters import HTTPAdapter
 import os
 
 class Result:
@@ -28,13 +29,28 @@ class Result:
         return f"CarthooksResult(success={self.success}, data={self.data}, error={self.error})"
 
 class Client:
-    def __init__(self):
+    def __init__(self, max_keepalive_connections=10):
         self.base_url = os.getenv('CARTHOOKS_API_URL')
         if self.base_url == None:
             self.base_url = "https://api.carthooks.com"
         self.headers = {
             'Content-Type': 'application/json',
         }
+        # A Client is meant to be long-lived: the session keeps connections
+        # alive so later calls skip the TCP/TLS handshake.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=max_keepalive_connections)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def setAccessToken(self, access_token):
         self.headers['Authorization'] = f'Bearer {access_token}'
@@ -44,11 +60,11 @@ class Client:
         options['pagination[pageSize]'] = limit
         url = f'{self.base_url}/v1/apps/{app_id}/collections/{collection_id}/items'
         print(options)
-        response = requests.get(url, headers=self.headers, params=options)
+        response = self.session.get(url, headers=self.headers, params=options)
         return Result(response)
     
     def getItemById(self, app_id, collection_id, item_id, fields=None):
-        response = requests.get(f'{self.base_url}/v1/apps/{app_id}/collections/{collection_id}/items/{item_id}', headers=self.headers)
+        response = self.session.get(f'{self.base_url}/v1/apps/{app_id}/collections/{collection_id}/items/{item_id}', headers=self.headers)
         return Result(response)
     
 
@@ -56,48 +72,48 @@ class Client:
 # PUT     /open/api/v1/apps/:app_id/collections/:entity_id/items/:row_id/subform/:field_id/items/:sub_row_id/:sub_row_id     OpenAPI.UpdateSubItem
 # DELETE  /open/api/v1/apps/:app_id/collections/:entity_id/items/:row_id/subform/:field_id/items/:sub_row_id/:sub_row_id     OpenAPI.DeleteSubItem
     def createSubItem(self, app_id, collection_id, item_id, field_id, data):
-        response = requests.post(f'{self.base_url}/v1/apps/{app_id}/collections/{collection_id}/items/{item_id}/subform/{field_id}', headers=self.headers, json={'data': data})
+        response = self.session.post(f'{self.base_url}/v1/apps/{app_id}/collections/{collection_id}/items/{item_id}/subform/{field_id}', headers=self.headers, json={'data': data})
         return Result(response)
     
     def updateSubItem(self, app_id, collection_id, item_id, field_id, sub_item_id, data):
         print("data", data)
-        response = requests.put(f'{self.base_url}/v1/apps/{app_id}/collections/{collection_id}/items/{item_id}/subform/{field_id}/items/{sub_item_id}', headers=self.headers, json={'data': data})
+        response = self.session.put(f'{self.base_url}/v1/apps/{app_id}/collections/{collection_id}/items/{item_id}/subform/{field_id}/items/{sub_item_id}', headers=self.headers, json={'data': data})
         return Result(response)
     
     def deleteSubItem(self, app_id, collection_id, item_id, field_id, sub_item_id):
-        response = requests.delete(f'{self.base_url}/v1/apps/{app_id}/collections/{collection_id}/items/{item_id}/subform/{field_id}/items/{sub_item_id}', headers=self.headers)
+        response = self.session.delete(f'{self.base_url}/v1/apps/{app_id}/collections/{collection_id}/items/{item_id}/subform/{field_id}/items/{sub_item_id}', headers=self.headers)
         return Result(response)
     
     def getSubmissionToken(self, app_id, collection_id, options):
-        response = requests.post(f'{self.base_url}/v1/apps/{app_id}/collections/{collection_id}/submission-token', headers=self.headers, json=options)
+        response = self.session.post(f'{self.base_url}/v1/apps/{app_id}/collections/{collection_id}/submission-token', headers=self.headers, json=options)
         return Result(response)
     
     def updateSubmissionToken(self, app_id, collection_id, item_id, options):
-        response = requests.post(f'{self.base_url}/v1/apps/{app_id}/collections/{collection_id}/items/{item_id}/update-token', headers=self.headers, json=options)
+        response = self.session.post(f'{self.base_url}/v1/apps/{app_id}/collections/{collection_id}/items/{item_id}/update-token', headers=self.headers, json=options)
         return Result(response)
     
     def createItem(self, app_id, collection_id, data):
-        response = requests.post(f'{self.base_url}/v1/apps/{app_id}/collections/{collection_id}/items', headers=self.headers, json={'data': data})
+        response = self.session.post(f'{self.base_url}/v1/apps/{app_id}/collections/{collection_id}/items', headers=self.headers, json={'data': data})
         return Result(response)
     
     def updateItem(self, app_id, collection_id, item_id, data):
-        response = requests.put(f'{self.base_url}/v1/apps/{app_id}/collections/{collection_id}/items/{item_id}', headers=self.headers, json={'data': data})
+        response = self.session.put(f'{self.base_url}/v1/apps/{app_id}/collections/{collection_id}/items/{item_id}', headers=self.headers, json={'data': data})
         return Result(response)
     
     def lockItem(self, app_id, collection_id, item_id, lock_timeout=600, lock_id=None, subject=None):
-        response = requests.post(f'{self.base_url}/v1/apps/{app_id}/collections/{collection_id}/items/{item_id}/lock', 
-                                 headers=self.headers, json={'lockTimeout': lock_timeout, 'lockId': lock_id, 'lockSubject': subject}) 
+        response = self.session.post(f'{self.base_url}/v1/apps/{app_id}/collections/{collection_id}/items/{item_id}/lock', 
+                                     headers=self.headers, json={'lockTimeout': lock_timeout, 'lockId': lock_id, 'lockSubject': subject}) 
         return Result(response)
     
     def unlockItem(self, app_id, collection_id, item_id, lock_id=None):
-        response = requests.post(f'{self.base_url}/v1/apps/{app_id}/collections/{collection_id}/items/{item_id}/unlock', headers=self.headers, json={'lockId': lock_id})
+        response = self.session.post(f'{self.base_url}/v1/apps/{app_id}/collections/{collection_id}/items/{item_id}/unlock', headers=self.headers, json={'lockId': lock_id})
         return Result(response)
     
     def deleteItem(self, app_id, collection_id, item_id):
-        response = requests.delete(f'{self.base_url}/v1/apps/{app_id}/collections/{collection_id}/items/{item_id}', headers=self.headers)
+        response = self.session.delete(f'{self.base_url}/v1/apps/{app_id}/collections/{collection_id}/items/{item_id}', headers=self.headers)
         return Result(response)
     
     def get_upload_token(self):
-        response = requests.post(f'{self.base_url}/v1/uploads/token', headers=self.headers)
+        response = self.session.post(f'{self.base_url}/v1/uploads/token', headers=self.headers)
         return Result(response)
     